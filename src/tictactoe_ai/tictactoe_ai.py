@@ -145,6 +145,12 @@ def select(stdscr: "_CursesWindow",
 
 class TicTacToeBoard:
 
+    __slots__ = (
+        "mt", "size", "ptw", "symbol", "players", "human_first",
+        "winning_boards", "search_count", "last_move", "level",
+        "history", "ply", "redo_top", "__ai_taunt",
+    )
+
     class InvalidMove(Exception):
         def __init__(self, *args: object, row=None, col=None) -> None:
             super().__init__(*args)
@@ -169,6 +175,12 @@ class TicTacToeBoard:
         self.search_count = 0
         self.last_move = -1, -1
         self.level = level + 3
+        # Undo stack of played moves. A game has at most size * size plies
+        # so the stack is allocated once. Entries in [ply, redo_top) are
+        # moves that were undone and can be redone.
+        self.history = [0] * (size * size)
+        self.ply = 0
+        self.redo_top = 0
         self.__ai_taunt = ""
 
     @property
@@ -184,21 +196,93 @@ class TicTacToeBoard:
                 0 <= col < self.size and
                 is_cell_set(self.mt, row, col))
 
+    def make_move(self, row: int, col: int, player: Player):
+        """
+        Play a move in place and push it onto the undo stack.
+        The cell is not validated, caller must make sure it is empty.
+        """
+        bit = 1 << (self.size - 1 - col)
+        self.mt[row] ^= bit
+        self.players[player][row] ^= bit
+        # record is cell index with the player in lowest bit
+        self.history[self.ply] = (row * self.size + col) << 1 | (player == COMP)
+        self.ply += 1
+
+    def unmake_move(self) -> Tuple[int, int, Player]:
+        """
+        Take back the last move in place. Return the undone move.
+        """
+        self.ply -= 1
+        record = self.history[self.ply]
+        player: Player = COMP if record & 1 else HUMN
+        row, col = divmod(record >> 1, self.size)
+        bit = 1 << (self.size - 1 - col)
+        self.mt[row] ^= bit
+        self.players[player][row] ^= bit
+        return row, col, player
+
     def move(self, row, col, player):
         if self.valid_move(row, col):
-            self.mt = flip_cell(self.mt, row, col)
-            self.players[player] = flip_cell(self.players[player], row, col)
+            self.make_move(row, col, player)
+            self.redo_top = self.ply
         else:
             raise self.InvalidMove(row, col)
 
     def unmove(self, row, col, player):
-        if not self.valid_move(row, col):
-            self.mt = flip_cell(self.mt, row, col)
-            self.players[player] = flip_cell(self.players[player], row, col)
+        if self.ply and self.history[self.ply - 1] == \
+                (row * self.size + col) << 1 | (player == COMP):
+            self.unmake_move()
         else:
             raise ValueError(
                 f"Cannot undo {row},{col},  a move haven't been played.")
 
+    def undo(self) -> Optional[Tuple[int, int, Player]]:
+        if self.ply == 0:
+            return None
+        move = self.unmake_move()
+        self._update_last_move()
+        return move
+
+    def redo(self) -> Optional[Tuple[int, int, Player]]:
+        if self.ply == self.redo_top:
+            return None
+        record = self.history[self.ply]
+        player: Player = COMP if record & 1 else HUMN
+        row, col = divmod(record >> 1, self.size)
+        self.make_move(row, col, player)
+        self._update_last_move()
+        return row, col, player
+
+    def take_back(self, player: Player) -> bool:
+        """
+        Undo moves until the last move of player is taken back.
+        """
+        record_player = player == COMP
+        if not any(self.history[i] & 1 == record_player
+                   for i in range(self.ply)):
+            return False
+        while self.undo()[2] != player:
+            pass
+        return True
+
+    def take_forward(self, player: Player) -> bool:
+        """
+        Redo moves until it is player's turn again.
+        """
+        if self.redo() is None:
+            return False
+        record_player = player == COMP
+        while (self.ply < self.redo_top and
+               self.history[self.ply] & 1 != record_player):
+            self.redo()
+        return True
+
+    def _update_last_move(self):
+        if self.ply:
+            self.last_move = divmod(self.history[self.ply - 1] >> 1, self.size)
+        else:
+            self.last_move = -1, -1
+
     def make_winning_boards(self, pieces_to_win):
         boards = []
         for r in range(self.size):
@@ -383,19 +467,19 @@ class TicTacToeBoard:
 
         for cell in empty_cells:
             r, c = cell
-            self.move(r, c, player)
+            self.make_move(r, c, player)
             if self.wins(player):
                 m = self.evaluate()
-                self.unmove(r, c, player)
+                self.unmake_move()
                 return m, r, c
             elif self.forks(player):
-                self.unmove(r, c, player)
+                self.unmake_move()
                 return player * inf, r, c
-            self.unmove(r, c, player)
+            self.unmake_move()
 
         for cell in self.empty_cells():
             x, y = cell[0], cell[1]
-            self.move(x, y, player)
+            self.make_move(x, y, player)
             min_moves = self.min_safe_moves_not_to_lose(player)
             if min_moves > self.level - depth and \
                     len(empty_cells) > self.max_depth():
@@ -405,7 +489,7 @@ class TicTacToeBoard:
             if m < score:
                 score = m
                 ax, ay = x, y
-            self.unmove(x, y, player)
+            self.unmake_move()
             if score <= alpha:
                 return score, ax, ay
             beta = min(beta, score)
@@ -424,19 +508,19 @@ class TicTacToeBoard:
             x[0] - self.size // 2)**2 + (x[0] - self.size//2)**2)
         for cell in empty_cells:
             r, c = cell
-            self.move(r, c, player)
+            self.make_move(r, c, player)
             if self.wins(player):
                 m = self.evaluate()
-                self.unmove(r, c, player)
+                self.unmake_move()
                 return m, r, c
             elif self.forks(player):
-                self.unmove(r, c, player)
+                self.unmake_move()
                 return player * inf, r, c
-            self.unmove(r, c, player)
+            self.unmake_move()
 
         for cell in empty_cells:
             r, c = cell
-            self.move(r, c, player)
+            self.make_move(r, c, player)
             min_moves = self.min_safe_moves_not_to_lose(player)
             if min_moves > self.level - depth and \
                     len(empty_cells) > self.max_depth():
@@ -446,7 +530,7 @@ class TicTacToeBoard:
             if m > score:
                 score = m
                 ax, ay = r, c
-            self.unmove(r, c, player)
+            self.unmake_move()
             if score >= beta:
                 return score, ax, ay
             alpha = max(alpha, score)
@@ -543,11 +627,30 @@ class TicTacToeBoard:
         _, old_mask = mousemask(KEY_MOUSE | REPORT_MOUSE_POSITION)
         while True:
             x = select(stdscr,
-                       "Select row: ",
+                       "Select row (u: undo, r: redo): ",
                        list(map(str, range(1, self.size + 1))) +
-                       ['KEY_MOUSE'],
+                       ['KEY_MOUSE', 'u', 'r'],
                        clear=lambda: self.render(stdscr))
-            if x != 'KEY_MOUSE':
+            if x in ('u', 'r'):
+                if x == 'u':
+                    changed = self.take_back(HUMN)
+                else:
+                    changed = self.take_forward(HUMN)
+                if changed:
+                    self.__ai_taunt = ""
+                    self.render(stdscr)
+                    if self.game_over():
+                        mousemask(old_mask)
+                        return None
+                else:
+                    try:
+                        stdscr.addstr("Nothing to undo\n" if x == 'u'
+                                      else "Nothing to redo\n")
+                    except CursesError:
+                        self.render(stdscr)
+                    stdscr.refresh()
+                continue
+            elif x != 'KEY_MOUSE':
                 y = select(stdscr, "Select column: ",
                            list(map(str, range(1, self.size + 1))),
                            clear=lambda: self.render(stdscr))